@@ -1,17 +1,163 @@
 import json
 import logging
 import os
-import sys
+import time
 import traceback
-from functools import wraps
-from json.decoder import JSONDecodeError
+from concurrent.futures import ThreadPoolExecutor
 
 import boto3
 
+try:
+    import orjson
+
+    def _dumps(obj, default=None):
+        return orjson.dumps(obj, default=default).decode()
+
+    _loads = orjson.loads
+except ImportError:
+
+    def _dumps(obj, default=None):
+        return json.dumps(obj, default=default, separators=(",", ":"))
+
+    _loads = json.loads
+
 logger = logging.getLogger()
 logger.setLevel(os.getenv("LOG_LEVEL", logging.INFO))
 
 
+def _error_msg(exc):
+    """Serialize ``exc`` with its traceback as a structured JSON string."""
+    traceback_string = traceback.format_exception(type(exc), exc, exc.__traceback__)
+    return _dumps(
+        {
+            "errorType": type(exc).__name__,
+            "errorMessage": str(exc),
+            "stackTrace": traceback_string,
+        }
+    )
+
+
+def _log_invocation(calling_msg, event):
+    """Emit the standard invocation log lines for ``with_logging`` and
+    ``lambda_handler``."""
+    logger.info(calling_msg)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Environment variables: %s", _env_json())
+    if logger.isEnabledFor(logging.INFO):
+        try:
+            logger.info("Event: %s", _dumps(event, default=str))
+        except (TypeError, ValueError):
+            logger.warning("Unserializable event: %s", event)
+
+
+def _parse_body(event):
+    """Parse a str or bytes ``event["body"]`` as JSON in place."""
+    # type() is cheaper than isinstance() here and the body is only
+    # ever str, bytes, None or an already-parsed dict.
+    body = event.get("body")
+    if type(body) is str or type(body) is bytes:
+        event["body"] = _loads(body)
+
+
+def _cors_template(origin=None, credentials=False):
+    """Build the CORS header dict once, at decoration time."""
+    cors = {"Access-Control-Allow-Origin": origin if origin is not None else "*"}
+    if credentials:
+        cors["Access-Control-Allow-Credentials"] = "true"
+    return cors
+
+
+def _apply_cors(response, cors):
+    """Merge prebuilt CORS headers into ``response`` without overriding
+    headers the handler set itself."""
+    if response is None:
+        response = {}
+    headers = response.setdefault("headers", {})
+    for key, value in cors.items():
+        headers.setdefault(key, value)
+    return response
+
+
+def _copy_meta(src, dst):
+    """Copy just the metadata we care about from ``src`` to ``dst``.
+
+    A slimmer stand-in for :func:`functools.wraps` that skips the
+    ``WRAPPER_ASSIGNMENTS`` loop and the ``__wrapped__`` attribute,
+    trimming decoration-time work at cold-start import.
+    """
+    dst.__name__ = src.__name__
+    dst.__qualname__ = src.__qualname__
+    dst.__doc__ = src.__doc__
+    dst.__module__ = src.__module__
+    return dst
+
+
+# Serialized environment snapshot for the DEBUG log line. Lambda's
+# environment is fixed for the life of the container, so copy and
+# encode it at most once per cold start, and only if DEBUG is ever
+# emitted. with_ssm_parameters writes fetched values into os.environ,
+# so _export_ssm_parameters drops the snapshot to keep the dump honest.
+_ENV_SNAPSHOT_JSON = None
+
+
+def _env_json():
+    global _ENV_SNAPSHOT_JSON
+    if _ENV_SNAPSHOT_JSON is None:
+        _ENV_SNAPSHOT_JSON = _dumps(dict(os.environ))
+    return _ENV_SNAPSHOT_JSON
+
+
+# Lazily-constructed SSM client, shared across invocations. Lambda's
+# freeze/thaw cycle keeps module state alive between warm invocations,
+# so building the client once saves the boto3 bootstrap cost on every
+# subsequent call.
+_SSM_CLIENT = None
+
+
+def _get_ssm():
+    global _SSM_CLIENT
+    if _SSM_CLIENT is None:
+        _SSM_CLIENT = boto3.client("ssm")
+    return _SSM_CLIENT
+
+
+# Fetched SSM parameters, keyed by the sorted tuple of parameter names
+# and held for _PARAM_TTL seconds, so warm invocations within the TTL
+# skip the get_parameters round-trip.
+_PARAM_CACHE: dict[tuple, tuple[float, list]] = {}
+_PARAM_TTL = 300.0
+
+
+def _export_ssm_parameters(params, cache_key, chunks):
+    """Fetch ``params`` from SSM (via the TTL cache) and export them as
+    environment variables."""
+    now = time.monotonic()
+    cached = _PARAM_CACHE.get(cache_key)
+    if cached and now - cached[0] < _PARAM_TTL:
+        fetched = cached[1]
+    else:
+        ssm = _get_ssm()
+
+        def fetch(names):
+            return ssm.get_parameters(Names=names, WithDecryption=True)["Parameters"]
+
+        if len(chunks) == 1:
+            fetched = fetch(chunks[0])
+        else:
+            # boto3 clients are thread-safe, so fetch the chunks
+            # concurrently
+            workers = min(8, len(chunks))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                fetched = [p for batch in pool.map(fetch, chunks) for p in batch]
+        _PARAM_CACHE[cache_key] = (now, fetched)
+    for parameter in fetched:
+        os.environ[parameter["Name"]] = parameter["Value"]
+    # The environment just changed, so let the next DEBUG dump rebuild
+    # its snapshot.
+    global _ENV_SNAPSHOT_JSON
+    _ENV_SNAPSHOT_JSON = None
+
+
 def with_logging(handler):
     """
     Decorator which performs basic logging.
@@ -32,17 +178,13 @@ def with_logging(handler):
 
     """
 
-    @wraps(handler)
+    calling_msg = f"Calling {handler.__name__}"
+
     def wrapper(event, *args, **kwargs):
-        logger.info(f"Calling {handler.__name__}")
-        logger.debug(f"Environment variables: {json.dumps(os.environ.copy())}")
-        try:
-            logger.info(f"Event: {json.dumps(event, indent=2)}")
-        except JSONDecodeError:
-            logger.warn(f"JSONDecodeError: Event: {event}")
+        _log_invocation(calling_msg, event)
         return handler(event, *args, **kwargs)
 
-    return wrapper
+    return _copy_meta(handler, wrapper)
 
 
 def load_json_body(handler):
@@ -65,14 +207,12 @@ def load_json_body(handler):
         ValueError: No JSON object could be decoded
     """
 
-    @wraps(handler)
     def wrapper(event, *args, **kwargs):
-        if isinstance(event.get("body"), str):
-            event["body"] = json.loads(event["body"])
+        _parse_body(event)
 
         return handler(event, *args, **kwargs)
 
-    return wrapper
+    return _copy_meta(handler, wrapper)
 
 
 def catch_errors(handler):
@@ -89,25 +229,11 @@ def catch_errors(handler):
         ...     raise ValueError("boo")
         >>>
         >>> my_handler({}, {})
-        ERROR    root:decorators.py:119 {"errorType": "ValueError", "errorMessage": "boo", "stackTrace":...
+        ERROR    root:decorators.py:119 {"errorType":"ValueError","errorMessage":"boo","stackTrace":...
 
     """
 
-    @wraps(handler)
     def wrapper(event, context):
-        def error_msg():
-            exception_type, exception_value, exception_traceback = sys.exc_info()
-            traceback_string = traceback.format_exception(
-                exception_type, exception_value, exception_traceback
-            )
-            return json.dumps(
-                {
-                    "errorType": exception_type.__name__,
-                    "errorMessage": str(exception_value),
-                    "stackTrace": traceback_string,
-                }
-            )
-
         try:
             return handler(event, context)
 
@@ -117,10 +243,13 @@ def catch_errors(handler):
         # so that the function is marked as a failure. Hence,
         # just the catch-all Exception.
         except Exception as e:
-            logger.error(error_msg())
+            # Formatting the traceback walks every frame, so only pay
+            # for it when an ERROR record would actually be emitted.
+            if logger.isEnabledFor(logging.ERROR):
+                logger.error(_error_msg(e))
             raise e
 
-    return wrapper
+    return _copy_meta(handler, wrapper)
 
 
 def with_ssm_parameters(*parameters):
@@ -140,21 +269,21 @@ def with_ssm_parameters(*parameters):
     """
 
     def wrapper_wrapper(handler):
-        @wraps(handler)
-        def wrapper(event, context):
-            # make sure parameters contains valid strings
-            params = [p for p in parameters if isinstance(p, str)]
+        # make sure parameters contains valid strings; the decorator
+        # arguments never change, so filter once here instead of on
+        # every invocation
+        params = [p for p in parameters if isinstance(p, str)]
+        cache_key = tuple(sorted(params))
+        # get_parameters accepts at most 10 names per call
+        chunks = [params[i : i + 10] for i in range(0, len(params), 10)]
 
+        def wrapper(event, context):
             if params:
-                ssm = boto3.client("ssm")
-                for parameter in ssm.get_parameters(Names=params, WithDecryption=True)[
-                    "Parameters"
-                ]:
-                    os.environ[parameter["Name"]] = parameter["Value"]
+                _export_ssm_parameters(params, cache_key, chunks)
 
             return handler(event, context)
 
-        return wrapper
+        return _copy_meta(handler, wrapper)
 
     return wrapper_wrapper
 
@@ -182,22 +311,74 @@ def cors_headers(origin=None, credentials=False):
                                        'Access-Control-Allow-Credentials': true}}
     """
 
+    # The headers depend only on the decorator arguments, so build them
+    # once here rather than key by key on every invocation.
+    cors = _cors_template(origin, credentials)
+
     def wrapper_wrapper(handler):
-        @wraps(handler)
         def wrapper(event, context):
-            response = handler(event, context)
-            if response is None:
-                response = {}
-            headers = response.setdefault("headers", {})
-            if origin is not None:
-                headers["Access-Control-Allow-Origin"] = origin
-            else:
-                headers["Access-Control-Allow-Origin"] = "*"
-            if credentials:
-                response["headers"]["Access-Control-Allow-Credentials"] = "true"
+            return _apply_cors(handler(event, context), cors)
+
+        return _copy_meta(handler, wrapper)
+
+    return wrapper_wrapper
+
+
+def lambda_handler(log=True, load_json=False, catch=True, cors=None, ssm=None):
+    """
+    Decorator which fuses the individual decorators into a single
+    wrapper, so a fully-dressed handler pays one function call per
+    invocation instead of one per stacked decorator.
+
+    ``log`` enables the ``with_logging`` behaviour, ``load_json`` the
+    ``load_json_body`` behaviour and ``catch`` the ``catch_errors``
+    behaviour. ``cors`` takes ``True`` for default CORS headers or a
+    dict of ``cors_headers`` keyword arguments. ``ssm`` takes the
+    parameter names that ``with_ssm_parameters`` would.
+
+    Usage::
+
+        >>> from lambda_decorators import lambda_handler
+        >>>
+        >>> @lambda_handler(load_json=True, cors={"origin": "https://example.com"})
+        ... def my_handler(event, context):
+        ...     return {"body": event["body"]["message"]}
+    """
+
+    if cors is True:
+        cors = {}
+    cors_hdrs = _cors_template(**cors) if cors is not None else None
+
+    params = [p for p in (ssm or ()) if isinstance(p, str)]
+    cache_key = tuple(sorted(params))
+    chunks = [params[i : i + 10] for i in range(0, len(params), 10)]
+
+    def wrapper_wrapper(handler):
+        calling_msg = f"Calling {handler.__name__}"
+
+        def wrapper(event, context):
+            if log:
+                _log_invocation(calling_msg, event)
+
+            if params:
+                _export_ssm_parameters(params, cache_key, chunks)
+
+            if load_json:
+                _parse_body(event)
+
+            try:
+                response = handler(event, context)
+            except Exception as e:
+                if catch and logger.isEnabledFor(logging.ERROR):
+                    logger.error(_error_msg(e))
+                raise e
+
+            if cors_hdrs is not None:
+                response = _apply_cors(response, cors_hdrs)
+
             return response
 
-        return wrapper
+        return _copy_meta(handler, wrapper)
 
     return wrapper_wrapper
 
@@ -208,4 +389,5 @@ __all__ = [
     "catch_errors",
     "with_ssm_parameters",
     "cors_headers",
+    "lambda_handler",
 ]
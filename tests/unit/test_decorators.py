@@ -10,6 +10,7 @@ from botocore.exceptions import ClientError
 from decorators import (
     catch_errors,
     cors_headers,
+    lambda_handler,
     load_json_body,
     with_logging,
     with_ssm_parameters,
@@ -59,7 +60,7 @@ def test_with_logging(caplog):
     assert caplog.records[1].levelno == logging.DEBUG
     assert caplog.records[1].module == "decorators"
 
-    assert caplog.records[2].message == 'Event: {\n  "boo": "ya"\n}'
+    assert caplog.records[2].message == 'Event: {"boo":"ya"}'
     assert caplog.records[2].levelno == logging.INFO
     assert caplog.records[2].module == "decorators"
 
@@ -97,8 +98,7 @@ def test_catch_errors_value(caplog):
         handler({"body": "Hello World"}, {})
 
     assert (
-        '''"errorType": "ValueError", "errorMessage": "boo"'''
-        in caplog.records[0].message
+        '''"errorType":"ValueError","errorMessage":"boo"''' in caplog.records[0].message
     )
     assert caplog.records[0].levelno == logging.ERROR
     assert caplog.records[0].module == "decorators"
@@ -121,7 +121,7 @@ def test_catch_errors_client(caplog):
         handler({"body": "Hello World"}, {})
 
     assert (
-        '''"errorType": "ClientError", "errorMessage": "An error occurred (MyErrorCode) when calling the \
+        '''"errorType":"ClientError","errorMessage":"An error occurred (MyErrorCode) when calling the \
 operation_name operation: My error message"'''
         in caplog.records[0].message
     )
@@ -139,7 +139,7 @@ def test_catch_errors_jsondecoder(caplog):
         handler("Hello World", {})
 
     assert (
-        """"errorType": "JSONDecodeError", "errorMessage": "Expecting value:"""
+        """"errorType":"JSONDecodeError","errorMessage":"Expecting value:"""
         in caplog.records[0].message
     )
     assert caplog.records[0].levelno == logging.ERROR
@@ -187,6 +187,25 @@ def test_with_ssm_parameters_multi(ssm_client):
     assert my_handler({}, {}) == ("Bar", "Chu")
 
 
+# test with_ssm_parameters with more than 10 parameters (chunked fetch)
+def test_with_ssm_parameters_many(ssm_client):
+
+    names = [f"/test/many/{i}" for i in range(12)]
+    for i, name in enumerate(names):
+        ssm_client.put_parameter(
+            Name=name,
+            Description=f"Test parameter {i}",
+            Value=f"value-{i}",
+            Type="SecureString",
+        )
+
+    @with_ssm_parameters(*names)
+    def my_handler(event, context):
+        return [os.getenv(name) for name in names]
+
+    assert my_handler({}, {}) == [f"value-{i}" for i in range(12)]
+
+
 # test with_ssm_parameters with missing parameter
 def test_with_ssm_parameters_none(ssm_client):
 
@@ -233,6 +252,22 @@ def test_cors_headers_with_origin():
     }
 
 
+# test cors_headers keeps headers already set by the handler
+def test_cors_headers_handler_set():
+
+    @cors_headers(origin="https://example.com")
+    def my_handler(event, context):
+        return {
+            "body": "foobar",
+            "headers": {"Access-Control-Allow-Origin": "https://other.example.com"},
+        }
+
+    assert my_handler({}, object()) == {
+        "body": "foobar",
+        "headers": {"Access-Control-Allow-Origin": "https://other.example.com"},
+    }
+
+
 # test cors_headers with credentials
 def test_cors_headers_with_credentials():
 
@@ -247,3 +282,53 @@ def test_cors_headers_with_credentials():
             "Access-Control-Allow-Credentials": "true",
         },
     }
+
+
+# test the fused lambda_handler decorator
+def test_lambda_handler(caplog):
+    caplog.set_level(logging.DEBUG)
+
+    @lambda_handler(load_json=True, cors={"origin": "https://example.com"})
+    def my_handler(event, context):
+        return {"body": event["body"]["message"]}
+
+    assert my_handler({"body": '{"message": "Hello World"}'}, {}) == {
+        "body": "Hello World",
+        "headers": {"Access-Control-Allow-Origin": "https://example.com"},
+    }
+
+    assert caplog.records[0].message == "Calling my_handler"
+    assert "Environment variables" in caplog.records[1].message
+
+
+# test lambda_handler logs and re-raises errors
+def test_lambda_handler_catch(caplog):
+
+    @lambda_handler(log=False)
+    def my_handler(event, context):
+        raise ValueError("boo")
+
+    with pytest.raises(ValueError, match=r"boo"):
+        my_handler({}, {})
+
+    assert (
+        '''"errorType":"ValueError","errorMessage":"boo"''' in caplog.records[0].message
+    )
+    assert caplog.records[0].levelno == logging.ERROR
+
+
+# test lambda_handler fetches SSM parameters
+def test_lambda_handler_ssm(ssm_client):
+
+    ssm_client.put_parameter(
+        Name="/test/fused",
+        Description="A test parameter",
+        Value="Bar",
+        Type="SecureString",
+    )
+
+    @lambda_handler(log=False, ssm=["/test/fused"])
+    def my_handler(event, context):
+        return {"body": os.getenv("/test/fused")}
+
+    assert my_handler({}, {}) == {"body": "Bar"}